@@ -6,37 +6,151 @@ all data related to customer locations and facility locations. It handles
 adding, clearing, and importing data.
 """
 
+import numpy as np
 import pandas as pd
+from openpyxl import load_workbook
+from scipy.spatial import cKDTree
 from tkinter import filedialog, messagebox
 
 class DataManager:
     """
     Manages all data for the application, including customer and facility locations.
 
+    Customer coordinates are stored as two parallel float64 arrays (x and y)
+    that grow geometrically, so numeric code can use them without converting
+    from Python objects. Customers added after an optimization are assigned
+    to their nearest optimal facility, so the results stay consistent without
+    re-running K-Means.
+
     Attributes:
-        customer_data (list): A list of tuples storing customer (x, y) coordinates.
         initial_facility_locations (list): A list of tuples for initial facility (x, y) coordinates.
         optimal_facility_locations (numpy.ndarray or None): The optimized facility locations from K-Means.
-        cluster_labels (numpy.ndarray or None): The cluster assignment for each customer.
+        cluster_labels (numpy.ndarray or None): The int32 cluster assignment for each customer.
+        cluster_radii (numpy.ndarray or None): The distance from each optimal facility
+                                               to its farthest assigned customer.
     """
     def __init__(self):
         """Initializes the DataManager with empty data lists."""
-        self.customer_data = []
+        self._xs = np.empty(0, dtype=np.float64)
+        self._ys = np.empty(0, dtype=np.float64)
+        self._n = 0
+        self._version = 0
+        self._customer_xy = None
+        self._customer_xy_version = -1
         self.initial_facility_locations = []
         self.optimal_facility_locations = None
         self.cluster_labels = None
+        self.cluster_radii = None
+        self._facility_tree = None
+
+    @property
+    def num_customers(self):
+        """int: The number of customer locations."""
+        return self._n
+
+    @property
+    def customer_xs(self):
+        """numpy.ndarray: The customer x coordinates (a view, valid until the next change)."""
+        return self._xs[:self._n]
+
+    @property
+    def customer_ys(self):
+        """numpy.ndarray: The customer y coordinates (a view, valid until the next change)."""
+        return self._ys[:self._n]
+
+    @property
+    def customer_version(self):
+        """int: A counter that changes whenever the customer data changes."""
+        return self._version
+
+    @property
+    def customer_xy(self):
+        """numpy.ndarray: The customer locations as an (N, 2) array, rebuilt only after changes."""
+        if self._customer_xy_version != self._version:
+            self._customer_xy = np.column_stack((self.customer_xs, self.customer_ys))
+            self._customer_xy_version = self._version
+        return self._customer_xy
+
+    def _reserve(self, capacity):
+        """Grows the customer buffers, at least doubling them, to hold `capacity` entries."""
+        if capacity <= len(self._xs):
+            return
+        capacity = max(capacity, 2 * len(self._xs))
+        self._xs = np.resize(self._xs, capacity)
+        self._ys = np.resize(self._ys, capacity)
 
     def add_customer(self, x, y):
         """Adds a new customer location to the data."""
-        self.customer_data.append((x, y))
+        self._reserve(self._n + 1)
+        self._xs[self._n] = x
+        self._ys[self._n] = y
+        self._n += 1
+        self._version += 1
+        self._assign_new_customers(self._n - 1)
+
+    def add_customers(self, xs, ys):
+        """
+        Adds many customer locations at once.
+
+        Args:
+            xs (array-like): The x coordinates of the new customers.
+            ys (array-like): The y coordinates of the new customers.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        end = self._n + len(xs)
+        self._reserve(end)
+        self._xs[self._n:end] = xs
+        self._ys[self._n:end] = ys
+        start = self._n
+        self._n = end
+        self._version += 1
+        self._assign_new_customers(start)
+
+    def _assign_new_customers(self, start):
+        """
+        Assigns the customers from index `start` onwards to their nearest
+        optimal facility, growing the service-area radii as needed.
+        Does nothing if there are no cluster assignments to extend.
+        """
+        if self.cluster_labels is None:
+            return
+        xy = np.column_stack((self._xs[start:self._n], self._ys[start:self._n]))
+        distances, labels = self.assign(xy)
+        self.cluster_labels = np.concatenate((self.cluster_labels, labels))
+        np.maximum.at(self.cluster_radii, labels, distances)
+
+    def assign(self, xy):
+        """
+        Finds the nearest optimal facility for each location.
+
+        Only valid once optimal facilities have been set.
+
+        Args:
+            xy (numpy.ndarray): An (M, 2) array of locations.
+
+        Returns:
+            tuple: A tuple containing:
+                   - numpy.ndarray: The distance to the nearest facility.
+                   - numpy.ndarray: The int32 index of the nearest facility.
+        """
+        distances, labels = self._facility_tree.query(xy, k=1)
+        return distances, labels.astype(np.int32)
 
     def add_initial_facility(self, x, y):
         """Adds a new initial facility location to the data."""
         self.initial_facility_locations.append((x, y))
 
     def clear_customers(self):
-        """Clears all customer data."""
-        self.customer_data = []
+        """Clears all customer data, along with the optimization results computed from it."""
+        self._xs = np.empty(0, dtype=np.float64)
+        self._ys = np.empty(0, dtype=np.float64)
+        self._n = 0
+        self._version += 1
+        self.optimal_facility_locations = None
+        self.cluster_labels = None
+        self.cluster_radii = None
+        self._facility_tree = None
 
     def clear_facilities(self):
         """
@@ -45,17 +159,98 @@ class DataManager:
         self.initial_facility_locations = []
         self.optimal_facility_locations = None
         self.cluster_labels = None
+        self.cluster_radii = None
+        self._facility_tree = None
 
     def set_optimal_facilities(self, locations, labels):
         """
-        Sets the results of the optimization.
+        Sets the results of the optimization and computes the service-area
+        radius of each facility.
 
         Args:
             locations (numpy.ndarray): The calculated optimal facility locations.
             labels (numpy.ndarray): The cluster labels for each customer.
+
+        Raises:
+            ValueError: If the facility locations are not finite. The previous
+                        results are left unchanged.
         """
+        # int32 labels halve the memory traffic of every scan over them
+        labels = labels.astype(np.int32, copy=False)
+
+        # Take the per-cluster maximum of the squared distances, so only
+        # k square roots are needed instead of one per customer
+        dx = self.customer_xs - locations[labels, 0]
+        dy = self.customer_ys - locations[labels, 1]
+        radii_squared = np.zeros(len(locations))
+        np.maximum.at(radii_squared, labels, dx * dx + dy * dy)
+        radii = np.sqrt(radii_squared)
+
+        tree = cKDTree(locations)
+
+        # Only store the results once everything above has succeeded, so a
+        # failure never leaves labels without the tree that extends them
         self.optimal_facility_locations = locations
         self.cluster_labels = labels
+        self.cluster_radii = radii
+        self._facility_tree = tree
+
+    def _read_xy_excel(self, filepath):
+        """
+        Reads the 'X' and 'Y' columns of an Excel file as float64 arrays.
+
+        .xlsx files are streamed row by row with openpyxl in read-only mode,
+        straight into the coordinate lists, without building a DataFrame.
+        Legacy .xls files, which openpyxl cannot open, go through pandas.
+
+        Args:
+            filepath (str): The path to the Excel file.
+
+        Returns:
+            tuple or None: The (xs, ys) arrays, or None if either column is missing.
+        """
+        if filepath.lower().endswith('.xls'):
+            df = pd.read_excel(
+                filepath,
+                usecols=lambda column: column in ('X', 'Y'),
+                dtype={'X': np.float64, 'Y': np.float64}
+            )
+            if 'X' not in df.columns or 'Y' not in df.columns:
+                return None
+            return (df['X'].to_numpy(dtype=np.float64, copy=False),
+                    df['Y'].to_numpy(dtype=np.float64, copy=False))
+
+        workbook = load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            # Same sheet pd.read_excel reads by default, not whichever was active on save
+            sheet = workbook.worksheets[0]
+            # The stored <dimension> tag can be wrong or missing, and iter_rows
+            # would otherwise stop at it; make openpyxl scan the real extent
+            sheet.reset_dimensions()
+            header = next(sheet.iter_rows(max_row=1, values_only=True), ())
+            if 'X' not in header or 'Y' not in header:
+                return None
+
+            # Only parse the columns spanning X and Y; the rows come back padded to that range
+            x_col = header.index('X')
+            y_col = header.index('Y')
+            first_col = min(x_col, y_col)
+            last_col = max(x_col, y_col)
+
+            xs = []
+            ys = []
+            for row in sheet.iter_rows(min_row=2, min_col=first_col + 1, max_col=last_col + 1,
+                                       values_only=True):
+                x = row[x_col - first_col]
+                y = row[y_col - first_col]
+                if x is None and y is None:
+                    continue
+                xs.append(x)
+                ys.append(y)
+        finally:
+            workbook.close()
+
+        return np.array(xs, dtype=np.float64), np.array(ys, dtype=np.float64)
 
     def import_customers_excel(self):
         """
@@ -72,14 +267,14 @@ class DataManager:
             return False
             
         try:
-            df = pd.read_excel(filepath)
-            if 'X' not in df.columns or 'Y' not in df.columns:
+            xy = self._read_xy_excel(filepath)
+            if xy is None:
                 messagebox.showerror("Error", "Excel file must contain 'X' and 'Y' columns")
                 return False
                 
-            new_customers = list(zip(df['X'], df['Y']))
-            self.customer_data.extend(new_customers)
-            messagebox.showinfo("Success", f"Added {len(new_customers)} customer locations from Excel")
+            xs, ys = xy
+            self.add_customers(xs, ys)
+            messagebox.showinfo("Success", f"Added {len(xs)} customer locations from Excel")
             return True
             
         except Exception as e:
@@ -101,12 +296,13 @@ class DataManager:
             return False
             
         try:
-            df = pd.read_excel(filepath)
-            if 'X' not in df.columns or 'Y' not in df.columns:
+            xy = self._read_xy_excel(filepath)
+            if xy is None:
                 messagebox.showerror("Error", "Excel file must contain 'X' and 'Y' columns")
                 return False
                 
-            new_facilities = list(zip(df['X'], df['Y']))
+            xs, ys = xy
+            new_facilities = list(zip(xs.tolist(), ys.tolist()))
             self.initial_facility_locations.extend(new_facilities)
             messagebox.showinfo("Success", f"Added {len(new_facilities)} facility locations from Excel")
             return True
@@ -7,9 +7,14 @@ and orchestrates the interactions between the data manager, optimizer, and plott
 
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
+import numpy as np
 from data_manager import DataManager
 from optimizer import Optimizer
 from plotter import Plotter
+from kernels import warmup as warmup_kernels
+
+# Longest list shown in the location text widgets; larger lists are summarized
+MAX_LIST_ROWS = 1000
 
 class KMeansApp:
     """
@@ -34,10 +39,16 @@ class KMeansApp:
         self.data_manager = DataManager()
         self.optimizer = Optimizer()
         self.plotter = Plotter(root)
+        self._update_pending = False
+        self._customer_list_version = None
         
         # Set up a reference for the plotter to access app data
         self.plotter.set_data(self.data_manager)
 
+        # Compile the optimization kernels up front so the first calculation
+        # doesn't pay the JIT cost
+        warmup_kernels()
+
         self._create_widgets()
         
         # Initial plot update
@@ -123,7 +134,22 @@ class KMeansApp:
         self._update_facility_list_display()
         self._update_optimal_facility_list_display()
         self.plotter.update_plot()
-        
+
+    def _schedule_update(self):
+        """
+        Requests a display update once Tk is idle.
+
+        Repeated requests before then collapse into a single update.
+        """
+        if not self._update_pending:
+            self._update_pending = True
+            self.root.after_idle(self._flush_update)
+
+    def _flush_update(self):
+        """Runs the pending display update."""
+        self._update_pending = False
+        self._update_display()
+
     def _add_customer(self):
         """Adds a customer location from the input fields and updates the display."""
         try:
@@ -132,7 +158,7 @@ class KMeansApp:
             self.data_manager.add_customer(x, y)
             self.customer_x_entry.delete(0, tk.END)
             self.customer_y_entry.delete(0, tk.END)
-            self._update_display()
+            self._schedule_update()
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid numbers for X and Y coordinates.")
 
@@ -144,19 +170,19 @@ class KMeansApp:
             self.data_manager.add_initial_facility(x, y)
             self.facility_x_entry.delete(0, tk.END)
             self.facility_y_entry.delete(0, tk.END)
-            self._update_display()
+            self._schedule_update()
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid numbers for X and Y coordinates.")
 
     def _import_customers_excel(self):
         """Handles the import of customer locations from an Excel file."""
         if self.data_manager.import_customers_excel():
-            self._update_display()
+            self._schedule_update()
 
     def _import_facilities_excel(self):
         """Handles the import of initial facility locations from an Excel file."""
         if self.data_manager.import_facilities_excel():
-            self._update_display()
+            self._schedule_update()
 
     def _clear_customers(self):
         """Clears all customer data and updates the display."""
@@ -172,33 +198,52 @@ class KMeansApp:
         
     def _update_customer_list_display(self):
         """Updates the scrolled text widget with the current customer data."""
-        self.customer_list_text.config(state=tk.NORMAL)
-        self.customer_list_text.delete(1.0, tk.END)
-        for i, (x, y) in enumerate(self.data_manager.customer_data):
-            self.customer_list_text.insert(tk.END, f"Customer {i+1}: ({x:.2f}, {y:.2f})\n")
-        self.customer_list_text.config(state=tk.DISABLED)
+        # The customer list can be long, so skip the rebuild when it hasn't changed
+        if self._customer_list_version == self.data_manager.customer_version:
+            return
+        self._customer_list_version = self.data_manager.customer_version
+
+        self._fill_location_list(self.customer_list_text, "Customer",
+                                 self.data_manager.customer_xy)
 
     def _update_facility_list_display(self):
         """Updates the scrolled text widget with the current initial facility data."""
-        self.facility_list_text.config(state=tk.NORMAL)
-        self.facility_list_text.delete(1.0, tk.END)
-        for i, (x, y) in enumerate(self.data_manager.initial_facility_locations):
-            self.facility_list_text.insert(tk.END, f"Facility {i+1}: ({x:.2f}, {y:.2f})\n")
-        self.facility_list_text.config(state=tk.DISABLED)
+        self._fill_location_list(self.facility_list_text, "Facility",
+                                 self.data_manager.initial_facility_locations)
 
     def _update_optimal_facility_list_display(self):
         """Updates the scrolled text widget with the current optimal facility data."""
-        self.optimal_facility_list_text.config(state=tk.NORMAL)
-        self.optimal_facility_list_text.delete(1.0, tk.END)
-        if self.data_manager.optimal_facility_locations is not None:
-            for i, (x, y) in enumerate(self.data_manager.optimal_facility_locations):
-                self.optimal_facility_list_text.insert(tk.END, 
-                    f"Facility {i+1}: ({x:.2f}, {y:.2f})\n")
-        self.optimal_facility_list_text.config(state=tk.DISABLED)
+        facilities = self.data_manager.optimal_facility_locations
+        self._fill_location_list(self.optimal_facility_list_text, "Facility",
+                                 facilities if facilities is not None else [])
+
+    def _fill_location_list(self, widget, name, locations):
+        """
+        Replaces the contents of a list widget with numbered locations.
+
+        The text is built up front and inserted in a single call. Only the
+        first MAX_LIST_ROWS locations are listed, followed by a count of the rest.
+
+        Args:
+            widget (scrolledtext.ScrolledText): The widget to fill.
+            name (str): The label for each row, e.g. "Customer".
+            locations (list or numpy.ndarray): The (x, y) locations to list.
+        """
+        shown = locations[:MAX_LIST_ROWS]
+        if isinstance(shown, np.ndarray):
+            shown = shown.tolist()
+        lines = [f"{name} {i+1}: ({x:.2f}, {y:.2f})\n" for i, (x, y) in enumerate(shown)]
+        if len(locations) > len(shown):
+            lines.append(f"... and {len(locations) - len(shown)} more\n")
+
+        widget.config(state=tk.NORMAL)
+        widget.delete(1.0, tk.END)
+        widget.insert(tk.END, "".join(lines))
+        widget.config(state=tk.DISABLED)
 
     def _run_calculation(self):
         """Triggers the K-Means calculation and updates the plot with the results."""
-        if not self.data_manager.customer_data:
+        if self.data_manager.num_customers == 0:
             messagebox.showwarning("No Customers", "Please add customer locations first.")
             return
         if not self.data_manager.initial_facility_locations:
@@ -207,7 +252,8 @@ class KMeansApp:
 
         try:
             optimal_locations, cluster_labels = self.optimizer.run_kmeans(
-                self.data_manager.customer_data,
+                self.data_manager.customer_xs,
+                self.data_manager.customer_ys,
                 self.data_manager.initial_facility_locations
             )
             self.data_manager.set_optimal_facilities(optimal_locations, cluster_labels)
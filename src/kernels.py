@@ -0,0 +1,108 @@
+"""
+kernels.py
+
+This module contains Numba-compiled kernels used by the Optimizer. All
+coordinates in this application are 2-D, so the kernels take x and y as
+separate contiguous arrays and hard-code the dimensionality instead of
+looping over an arbitrary number of features.
+"""
+
+import numpy as np
+from numba import njit, prange, get_num_threads
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def assign_2d(xs, ys, cx, cy, labels):
+    """
+    Assigns every point to its nearest centroid (the K-Means E-step).
+
+    Distances use the expansion ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2.
+    ||x||^2 is the same for every centroid, so it drops out of the argmin,
+    and ||c||^2 is computed once per call; each point-centroid pair then
+    costs two multiply-adds. The expansion loses precision far from the
+    origin, so callers should pass centered data.
+
+    Args:
+        xs (numpy.ndarray): The x coordinates of the points.
+        ys (numpy.ndarray): The y coordinates of the points.
+        cx (numpy.ndarray): The x coordinates of the centroids.
+        cy (numpy.ndarray): The y coordinates of the centroids.
+        labels (numpy.ndarray): Output array receiving the index of the
+                                nearest centroid for each point.
+    """
+    n = xs.shape[0]
+    k = cx.shape[0]
+    c_norms2 = cx * cx + cy * cy
+    for i in prange(n):
+        x = xs[i]
+        y = ys[i]
+        best = 0
+        best_d = c_norms2[0] - 2.0 * (x * cx[0] + y * cy[0])
+        for j in range(1, k):
+            d = c_norms2[j] - 2.0 * (x * cx[j] + y * cy[j])
+            if d < best_d:
+                best_d = d
+                best = j
+        labels[i] = best
+
+
+def update_centroids_2d(xs, ys, labels, cx, cy):
+    """
+    Moves every centroid to the mean of its assigned points (the K-Means M-step).
+
+    Each thread accumulates into its own row of the partial-sum buffers, so
+    no atomics are needed; the rows are reduced serially afterwards.
+    Centroids that lost all of their points are left where they are.
+
+    Args:
+        xs (numpy.ndarray): The x coordinates of the points.
+        ys (numpy.ndarray): The y coordinates of the points.
+        labels (numpy.ndarray): The cluster index of each point.
+        cx (numpy.ndarray): The x coordinates of the centroids, updated in place.
+        cy (numpy.ndarray): The y coordinates of the centroids, updated in place.
+    """
+    _update_centroids_2d(xs, ys, labels, cx, cy, get_num_threads())
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _update_centroids_2d(xs, ys, labels, cx, cy, n_chunks):
+    """Kernel behind update_centroids_2d, splitting the points into n_chunks."""
+    n = xs.shape[0]
+    k = cx.shape[0]
+    chunk = (n + n_chunks - 1) // n_chunks
+
+    sum_x = np.zeros((n_chunks, k))
+    sum_y = np.zeros((n_chunks, k))
+    counts = np.zeros((n_chunks, k), dtype=np.int64)
+
+    for t in prange(n_chunks):
+        start = t * chunk
+        stop = min(start + chunk, n)
+        for i in range(start, stop):
+            j = labels[i]
+            sum_x[t, j] += xs[i]
+            sum_y[t, j] += ys[i]
+            counts[t, j] += 1
+
+    for j in range(k):
+        total_x = 0.0
+        total_y = 0.0
+        total_count = 0
+        for t in range(n_chunks):
+            total_x += sum_x[t, j]
+            total_y += sum_y[t, j]
+            total_count += counts[t, j]
+        if total_count > 0:
+            cx[j] = total_x / total_count
+            cy[j] = total_y / total_count
+
+
+def warmup():
+    """Compiles (or loads from the on-disk cache) all kernels on a tiny input."""
+    xs = np.zeros(2)
+    ys = np.zeros(2)
+    cx = np.zeros(1)
+    cy = np.zeros(1)
+    labels = np.empty(2, dtype=np.int32)
+    assign_2d(xs, ys, cx, cy, labels)
+    update_centroids_2d(xs, ys, labels, cx, cy)
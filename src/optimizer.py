@@ -6,18 +6,29 @@ running the K-Means clustering algorithm to find optimal facility locations.
 """
 
 import numpy as np
-from sklearn.cluster import KMeans
+from kernels import assign_2d, update_centroids_2d
 
 class Optimizer:
     """
     Handles the K-Means clustering algorithm for facility location optimization.
+
+    Attributes:
+        max_iter (int): The maximum number of Lloyd iterations.
+        tol (float): Convergence tolerance on the squared centroid shift,
+                     relative to the mean variance of the customer data.
     """
-    def run_kmeans(self, customer_data, initial_facility_locations):
+    def __init__(self, max_iter=300, tol=1e-4):
+        """Initializes the Optimizer with the K-Means stopping criteria."""
+        self.max_iter = max_iter
+        self.tol = tol
+
+    def run_kmeans(self, customer_xs, customer_ys, initial_facility_locations):
         """
         Runs the K-Means algorithm on customer data using provided initial facility locations.
 
         Args:
-            customer_data (list): A list of (x, y) tuples for customer locations.
+            customer_xs (numpy.ndarray): The x coordinates of the customer locations.
+            customer_ys (numpy.ndarray): The y coordinates of the customer locations.
             initial_facility_locations (list): A list of (x, y) tuples for initial
                                                facility locations (used as initial centroids).
 
@@ -25,17 +36,66 @@ class Optimizer:
             tuple: A tuple containing:
                    - numpy.ndarray: The optimal facility locations (cluster centers).
                    - numpy.ndarray: The cluster labels for each customer.
+
+        Raises:
+            ValueError: If any customer or facility coordinate is NaN or infinite.
         """
-        customer_np_data = np.array(customer_data)
-        initial_locations = np.array(initial_facility_locations)
-        k = len(initial_locations)
+        initial_locations = np.array(initial_facility_locations, dtype=np.float64)
+
+        xs = np.asarray(customer_xs, dtype=np.float64)
+        ys = np.asarray(customer_ys, dtype=np.float64)
 
-        # Initialize KMeans with the user-provided initial locations
-        kmeans = KMeans(n_clusters=k, init=initial_locations, n_init=1, random_state=0)
-        kmeans.fit(customer_np_data)
+        if not (np.isfinite(xs).all() and np.isfinite(ys).all()
+                and np.isfinite(initial_locations).all()):
+            raise ValueError("All customer and facility coordinates must be finite numbers")
 
-        optimal_facility_locations = kmeans.cluster_centers_
-        cluster_labels = kmeans.labels_
+        # With a single facility the optimum is simply the customer centroid
+        if len(initial_locations) == 1:
+            optimal_facility_locations = np.array([[xs.mean(), ys.mean()]])
+            cluster_labels = np.zeros(len(xs), dtype=np.int32)
+            return optimal_facility_locations, cluster_labels
+
+        # Center the data so the expanded distances in assign_2d stay accurate
+        x_mean = xs.mean()
+        y_mean = ys.mean()
+        xs = xs - x_mean
+        ys = ys - y_mean
+
+        # Start from the user-provided initial locations
+        cx = initial_locations[:, 0] - x_mean
+        cy = initial_locations[:, 1] - y_mean
+
+        cluster_labels = self._lloyd_2d(xs, ys, cx, cy)
+        optimal_facility_locations = np.column_stack((cx + x_mean, cy + y_mean))
 
         return optimal_facility_locations, cluster_labels
 
+    def _lloyd_2d(self, xs, ys, cx, cy):
+        """
+        Runs Lloyd's algorithm with the compiled 2-D kernels.
+
+        The centroid arrays are updated in place. Like scikit-learn, the tolerance
+        is scaled by the mean variance of the data, and a final assignment step
+        keeps the labels consistent with the returned centroids.
+
+        This is plain Lloyd without Elkan's triangle-inequality pruning: with
+        only two dimensions the compiled full assignment was faster than
+        scikit-learn's Elkan at every input size measured.
+
+        Returns:
+            numpy.ndarray: The cluster labels for each customer.
+        """
+        labels = np.empty(len(xs), dtype=np.int32)
+        tol = self.tol * np.mean([np.var(xs), np.var(ys)])
+
+        for _ in range(self.max_iter):
+            assign_2d(xs, ys, cx, cy, labels)
+            old_cx = cx.copy()
+            old_cy = cy.copy()
+            update_centroids_2d(xs, ys, labels, cx, cy)
+            shift = np.sum((cx - old_cx) ** 2 + (cy - old_cy) ** 2)
+            if shift <= tol:
+                break
+
+        assign_2d(xs, ys, cx, cy, labels)
+        return labels
@@ -10,6 +10,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import matplotlib.patches as patches
+from matplotlib.collections import PatchCollection
+from matplotlib.lines import Line2D
 # We will get data from an instance of DataManager, so no direct import here
 # from data_manager import DataManager
 
@@ -32,6 +34,7 @@ class Plotter:
         self.canvas = None
         self.toolbar = None
         self.data_manager = None # This will be set by the main app
+        self._redraw_pending = False
 
     def set_data(self, data_manager):
         """Sets the reference to the DataManager instance."""
@@ -55,141 +58,190 @@ class Plotter:
         self.toolbar.update()
         self.canvas_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
+        self._create_artists()
+
+        # Catch up on updates that were skipped while the window was hidden
+        self.root.bind('<Map>', self._on_map, add='+')
+
+    def _on_map(self, event):
+        """Redraws the plot if an update was skipped while the window was not visible."""
+        # The root's tag is in every child's bindtags, so ignore <Map> from child widgets
+        if event.widget is self.root and self._redraw_pending:
+            self.update_plot()
+
     def update_plot(self):
         """
-        Clears the current plot and redraws all customer, initial facility,
-        and optimal facility locations based on the data in the DataManager.
+        Updates the long-lived plot artists with the current customer, initial
+        facility, and optimal facility locations from the DataManager.
+
+        Nothing is drawn while the window is not visible; the update is
+        deferred until the window is mapped again.
         """
-        self.ax.clear()
-        
-        customer_np_data = np.array(self.data_manager.customer_data)
+        if not self.root.winfo_viewable():
+            self._redraw_pending = True
+            return
+        self._redraw_pending = False
+
+        xs = self.data_manager.customer_xs
+        ys = self.data_manager.customer_ys
         initial_locations = np.array(self.data_manager.initial_facility_locations)
         optimal_locations = self.data_manager.optimal_facility_locations
         cluster_labels = self.data_manager.cluster_labels
+        legend_entries = []
 
-        if customer_np_data.size > 0:
+        if xs.size > 0:
             # Plot customer points
+            self._customer_scatter.set_offsets(self.data_manager.customer_xy)
             if cluster_labels is not None and optimal_locations is not None:
-                self._plot_clustered_customers(customer_np_data, optimal_locations, cluster_labels)
-                self._plot_optimal_facilities(optimal_locations, cluster_labels)
+                legend_entries += self._update_clustered_customers(optimal_locations, cluster_labels)
+                legend_entries += self._update_optimal_facilities(optimal_locations)
             else:
-                self.ax.scatter(customer_np_data[:, 0], customer_np_data[:, 1], 
-                                s=50, color='blue', label='Customer Locations')
+                self._customer_scatter.set_color('blue')
+                self._clear_optimal_facilities()
+                legend_entries.append((self._customer_scatter, 'Customer Locations'))
 
             # Plot initial facility locations if available
             if initial_locations.size > 0:
-                self.ax.scatter(initial_locations[:, 0], initial_locations[:, 1],
-                                marker='o', s=150, color='orange', 
-                                edgecolor='black', linewidth=1.5,
-                                label='Initial Facilities')
+                self._initial_scatter.set_offsets(initial_locations)
+                legend_entries.append((self._initial_scatter, 'Initial Facilities'))
+            else:
+                self._initial_scatter.set_offsets(np.empty((0, 2)))
+        else:
+            self._customer_scatter.set_offsets(np.empty((0, 2)))
+            self._initial_scatter.set_offsets(np.empty((0, 2)))
+            self._clear_optimal_facilities()
 
-            self._adjust_plot_limits(customer_np_data, initial_locations, optimal_locations)
+        self._adjust_plot_limits(xs, ys, initial_locations, optimal_locations)
 
-        # Set labels and legend
+        legend = self.ax.get_legend()
+        if legend_entries:
+            self.ax.legend(*zip(*legend_entries), loc='upper right')
+        elif legend is not None:
+            legend.remove()
+
+        self.canvas.draw_idle()
+
+    def _create_artists(self):
+        """
+        Creates the plot decorations and the empty artists that update_plot
+        refreshes in place, so redraws never rebuild the axes from scratch.
+        """
         self.ax.set_title('Facility Location Optimization with Service Areas', fontsize=16)
         self.ax.set_xlabel('X Coordinate')
         self.ax.set_ylabel('Y Coordinate')
         self.ax.grid(True)
-        
-        # Improved legend handling to avoid duplicate labels
-        handles, labels = self.ax.get_legend_handles_labels()
-        if handles:
-            unique = [(h, l) for i, (h, l) in enumerate(zip(handles, labels)) if l not in labels[:i]]
-            self.ax.legend(*zip(*unique), loc='upper right')
-        
-        self.canvas.draw()
 
-    def _plot_clustered_customers(self, customer_np_data, optimal_locations, cluster_labels):
-        """Plots customers colored by their assigned cluster."""
-        try:
-            cmap = plt.colormaps['tab10']
-        except AttributeError:
-            cmap = plt.get_cmap('tab10')
+        self._circles = PatchCollection([], alpha=0.15, linestyle='-', linewidth=1)
+        self.ax.add_collection(self._circles)
+        self._customer_scatter = self.ax.scatter([], [], s=50)
+        self._initial_scatter = self.ax.scatter([], [], marker='o', s=150, color='orange',
+                                                edgecolor='black', linewidth=1.5)
+        self._optimal_scatter = self.ax.scatter([], [], marker='X', s=200, color='red',
+                                                edgecolor='black', linewidth=2)
+        self._facility_labels = []
+        self._cluster_proxies = []
+
+    def _update_clustered_customers(self, optimal_locations, cluster_labels):
+        """
+        Colors customers by their assigned cluster.
 
-        for i in range(len(customer_np_data)):
-            color = cmap(cluster_labels[i] % cmap.N)
-            self.ax.scatter(customer_np_data[i, 0], customer_np_data[i, 1],
-                            color=color, s=50, alpha=0.7,
-                            label=f'Cluster {cluster_labels[i]+1}' if i == 0 else "")
+        Returns:
+            list: The (handle, label) legend entries, one per cluster.
+        """
+        cmap = self._get_cmap()
+
+        colors = cmap(cluster_labels % cmap.N)
+        colors[:, 3] = 0.7
+        self._customer_scatter.set_color(colors)
+
+        # One proxy artist per cluster so every cluster gets a legend entry
+        k = len(optimal_locations)
+        if len(self._cluster_proxies) != k:
+            self._cluster_proxies = [
+                Line2D([], [], marker='o', linestyle='', color=cmap(i % cmap.N), alpha=0.7)
+                for i in range(k)
+            ]
+        return [(proxy, f'Cluster {i+1}') for i, proxy in enumerate(self._cluster_proxies)]
+
+    def _update_optimal_facilities(self, optimal_locations):
+        """
+        Shows optimal facilities and their service areas (circles).
 
-    def _plot_optimal_facilities(self, optimal_locations, cluster_labels):
-        """Plots optimal facilities and their service areas (circles)."""
-        try:
-            cmap = plt.colormaps['tab10']
-        except AttributeError:
-            cmap = plt.get_cmap('tab10')
-
-        radii = []
-        for i in range(len(optimal_locations)):
-            cluster_points = np.array(self.data_manager.customer_data)[cluster_labels == i]
-            if len(cluster_points) > 0:
-                distances = np.linalg.norm(cluster_points - optimal_locations[i], axis=1)
-                radii.append(np.max(distances))
-            else:
-                radii.append(0)
-
-        for i, (facility, radius) in enumerate(zip(optimal_locations, radii)):
-            # Draw service area circle
-            circle = patches.Circle(
-                (facility[0], facility[1]),
-                radius,
-                color=cmap(i % cmap.N),
-                alpha=0.15,
-                fill=True,
-                linestyle='-',
-                linewidth=1
-            )
-            self.ax.add_patch(circle)
-            
-            # Draw facility marker
-            self.ax.scatter(facility[0], facility[1],
-                            marker='X', s=200, color='red', 
-                            edgecolor='black', linewidth=2,
-                            label='Optimal Facilities' if i == 0 else "")
-            
-            # Add facility number label
+        Returns:
+            list: The (handle, label) legend entry for the facility markers.
+        """
+        cmap = self._get_cmap()
+
+        # All service area circles live in a single collection
+        radii = self.data_manager.cluster_radii
+        circles = [patches.Circle((facility[0], facility[1]), radius)
+                   for facility, radius in zip(optimal_locations, radii)]
+        colors = cmap(np.arange(len(circles)) % cmap.N)
+        self._circles.set_paths(circles)
+        self._circles.set_facecolor(colors)
+        self._circles.set_edgecolor(colors)
+
+        # Add facility number labels
+        for text in self._facility_labels:
+            text.remove()
+        self._facility_labels = [
             self.ax.text(facility[0], facility[1], f'F{i+1}',
-                         ha='center', va='center', 
+                         ha='center', va='center',
                          color='black', fontweight='bold')
+            for i, facility in enumerate(optimal_locations)
+        ]
+
+        self._optimal_scatter.set_offsets(optimal_locations)
+        return [(self._optimal_scatter, 'Optimal Facilities')]
+
+    def _clear_optimal_facilities(self):
+        """Hides the optimal facility markers, labels, and service areas."""
+        self._circles.set_paths([])
+        self._optimal_scatter.set_offsets(np.empty((0, 2)))
+        for text in self._facility_labels:
+            text.remove()
+        self._facility_labels = []
+
+    def _get_cmap(self):
+        """Returns the colormap used for clusters and service areas."""
+        try:
+            return plt.colormaps['tab10']
+        except AttributeError:
+            return plt.get_cmap('tab10')
 
-    def _adjust_plot_limits(self, customer_data, initial_data, optimal_data):
+    def _adjust_plot_limits(self, xs, ys, initial_data, optimal_data):
         """Dynamically adjusts the plot limits to fit all data points and circles."""
-        all_x = []
-        all_y = []
-        if customer_data.size > 0:
-            all_x.extend(customer_data[:, 0])
-            all_y.extend(customer_data[:, 1])
+        if xs.size == 0:
+            self.ax.set_xlim(0, 1)
+            self.ax.set_ylim(0, 1)
+            return
+        min_x, max_x = xs.min(), xs.max()
+        min_y, max_y = ys.min(), ys.max()
+
         if initial_data.size > 0:
-            all_x.extend(initial_data[:, 0])
-            all_y.extend(initial_data[:, 1])
+            min_x = min(min_x, initial_data[:, 0].min())
+            max_x = max(max_x, initial_data[:, 0].max())
+            min_y = min(min_y, initial_data[:, 1].min())
+            max_y = max(max_y, initial_data[:, 1].max())
+
         if optimal_data is not None:
-            all_x.extend(optimal_data[:, 0])
-            all_y.extend(optimal_data[:, 1])
+            opt_x = optimal_data[:, 0]
+            opt_y = optimal_data[:, 1]
 
             # Include circle edges in the plot limits
-            if self.data_manager.cluster_labels is not None:
-                radii = []
-                for i in range(len(optimal_data)):
-                    cluster_points = np.array(self.data_manager.customer_data)[self.data_manager.cluster_labels == i]
-                    if len(cluster_points) > 0:
-                        distances = np.linalg.norm(cluster_points - optimal_data[i], axis=1)
-                        radii.append(np.max(distances))
-                    else:
-                        radii.append(0)
-                max_radius = max(radii) if radii else 0
-                all_x.extend([x + max_radius for x in optimal_data[:, 0]])
-                all_x.extend([x - max_radius for x in optimal_data[:, 0]])
-                all_y.extend([y + max_radius for y in optimal_data[:, 1]])
-                all_y.extend([y - max_radius for y in optimal_data[:, 1]])
-
-        if all_x and all_y:
-            min_x, max_x = np.min(all_x), np.max(all_x)
-            min_y, max_y = np.min(all_y), np.max(all_y)
-            
-            padding_x = (max_x - min_x) * 0.1
-            padding_y = (max_y - min_y) * 0.1
-            padding_x = padding_x if padding_x > 0 else 1.0
-            padding_y = padding_y if padding_y > 0 else 1.0
-            
-            self.ax.set_xlim(min_x - padding_x, max_x + padding_x)
-            self.ax.set_ylim(min_y - padding_y, max_y + padding_y)
+            radii = self.data_manager.cluster_radii
+            if radii is None:
+                radii = 0
+
+            min_x = min(min_x, (opt_x - radii).min())
+            max_x = max(max_x, (opt_x + radii).max())
+            min_y = min(min_y, (opt_y - radii).min())
+            max_y = max(max_y, (opt_y + radii).max())
+
+        padding_x = (max_x - min_x) * 0.1
+        padding_y = (max_y - min_y) * 0.1
+        padding_x = padding_x if padding_x > 0 else 1.0
+        padding_y = padding_y if padding_y > 0 else 1.0
+
+        self.ax.set_xlim(min_x - padding_x, max_x + padding_x)
+        self.ax.set_ylim(min_y - padding_y, max_y + padding_y)